@@ -3,65 +3,312 @@
 Это промежуточный слой между REST API и БД.
 """
 
+import io
 import os
-import base64
+import re
+import struct
 import logging
+import threading
+from binascii import a2b_base64
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.extensions import connection as BaseConnection, encodings, make_dsn
+from psycopg2.pool import ThreadedConnectionPool
+from dotenv import load_dotenv
+from app.models import SubmitPassData
+
+# Загружаем переменные окружения из файла .env
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5 мегабайт
 
+# Строка подключения к БД (собирается один раз при импорте модуля)
+DSN = make_dsn(
+    host=os.getenv('FSTR_DB_HOST', 'localhost'),
+    port=os.getenv('FSTR_DB_PORT', '5432'),
+    user=os.getenv('FSTR_DB_LOGIN', 'postgres'),
+    password=os.getenv('FSTR_DB_PASS', 'postgres'),
+    dbname=os.getenv('FSTR_DB_NAME', 'mountain_passes'),
+    application_name='mountain_api'
+)
+
+# Серверные подготовленные запросы (PREPARE) живут в сессии PostgreSQL.
+# За pgbouncer в режиме transaction pooling сессии общие, поэтому там
+# нужно выключить их: FSTR_DB_PREPARE=0
+USE_PREPARED_STATEMENTS = os.getenv('FSTR_DB_PREPARE', '1') != '0'
+
+# Начиная с такого числа или общего объёма фотографий они сохраняются через COPY
+COPY_MIN_IMAGES = 8
+COPY_MIN_BYTES = 2 * 1024 * 1024  # 2 мегабайта
+
+# Заголовок и завершение потока COPY ... (FORMAT binary).
+# Поток собирается под схему images (pass_id int4, title text, data bytea):
+# при смене типа images.pass_id (например, на bigint) нужно менять и build_copy_buffer
+COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+COPY_BINARY_TRAILER = struct.pack('!h', -1)
+
+# Размер пула соединений на один процесс приложения.
+# FSTR_DB_POOL_MAX — общий бюджет соединений на все worker-процессы
+# (число процессов берётся из WEB_CONCURRENCY, как у uvicorn), чтобы
+# workers × POOL_MAX_CONN не превысил max_connections PostgreSQL (по умолчанию 100)
+DB_POOL_TOTAL = int(os.getenv('FSTR_DB_POOL_MAX', '80'))
+WORKERS_COUNT = int(os.getenv('WEB_CONCURRENCY', '1'))
+POOL_MAX_CONN = max(1, min(25, DB_POOL_TOTAL // WORKERS_COUNT))
+POOL_MIN_CONN = min(5, POOL_MAX_CONN)
+
+# Общий пул соединений, создаётся при старте приложения (см. init_pool)
+POOL: Optional[ThreadedConnectionPool] = None
+POOL_LOCK = threading.Lock()
+
+# Подготовленные на сервере запросы (PREPARE), создаются один раз на соединение
+PREPARED_STATEMENTS = {
+    # Пользователь, перевал и уровни сложности одним запросом (один сетевой обмен).
+    # Требует ограничения UNIQUE(email) в таблице users
+    'ins_submission': """
+        WITH new_user AS (
+            INSERT INTO users (email, phone, fam, name, otc)
+            VALUES ($1, $2, $3, $4, $5)
+            -- пустое обновление: данные существующего пользователя не меняются,
+            -- но RETURNING всегда возвращает id
+            ON CONFLICT (email) DO UPDATE SET email = EXCLUDED.email
+            RETURNING id
+        ), new_pass AS (
+            INSERT INTO passes (beauty_title, title, other_titles, connect,
+                              add_time, user_id, latitude, longitude, height, status)
+            VALUES ($6, $7, $8, $9, $10, (SELECT id FROM new_user), $11, $12, $13, 'new')
+            RETURNING id
+        ), new_level AS (
+            INSERT INTO difficulty_levels (pass_id, winter, spring, summer, autumn)
+            VALUES ((SELECT id FROM new_pass), $14, $15, $16, $17)
+        )
+        SELECT id FROM new_pass
+    """,
+}
+
+
+def statement_sql(name: str) -> str:
+    """
+    SQL для запроса из PREPARED_STATEMENTS с параметрами в стиле psycopg2 (%s).
+
+    Args:
+        name: имя запроса
+
+    Returns:
+        EXECUTE name (...) если подготовленные запросы включены,
+        иначе сам запрос с $1, $2, ... заменёнными на %s
+    """
+    query = PREPARED_STATEMENTS[name]
+    if USE_PREPARED_STATEMENTS:
+        params_count = len(re.findall(r'\$\d+', query))
+        return f"EXECUTE {name} (" + ", ".join(["%s"] * params_count) + ")"
+    # Параметры в запросах идут по порядку, поэтому их можно заменить на %s
+    return re.sub(r'\$\d+', '%s', query)
+
+
+# SQL запросы собираются один раз при импорте модуля.
+# Все PREPARE отправляются одним запросом (один сетевой обмен)
+PREPARE_SQL = ";".join(f"PREPARE {name} AS {query}"
+                       for name, query in PREPARED_STATEMENTS.items())
+INSERT_SUBMISSION_SQL = statement_sql('ins_submission')
+INSERT_IMAGES_SQL = "INSERT INTO images (pass_id, title, data) VALUES %s"
+COPY_IMAGES_SQL = "COPY images (pass_id, title, data) FROM STDIN WITH (FORMAT binary)"
+PING_SQL = "SELECT 1"
+
+
+class PooledConnection(BaseConnection):
+    """
+    Соединение из пула.
+    Помнит, выполнены ли на нём PREPARE для PREPARED_STATEMENTS.
+    """
+    prepared = False
+
+
+def init_pool():
+    """
+    Создать пул соединений с PostgreSQL, если он ещё не создан.
+    Параметры подключения берутся из переменных окружения.
+    Если БД недоступна, выбрасывает psycopg2.Error.
+    """
+    global POOL
+    with POOL_LOCK:
+        if POOL is None:
+            POOL = ThreadedConnectionPool(
+                minconn=POOL_MIN_CONN,
+                maxconn=POOL_MAX_CONN,
+                dsn=DSN,
+                connection_factory=PooledConnection
+            )
+
+
+def get_pool() -> Optional[ThreadedConnectionPool]:
+    """
+    Получить пул соединений, при необходимости создав его.
+    Возвращает None, если БД недоступна (пул попробуем создать в следующий раз).
+    """
+    if POOL is None:
+        try:
+            init_pool()
+        except psycopg2.Error as e:
+            logger.error(f"Ошибка подключения к БД: {e}")
+            return None
+    return POOL
+
+
+def close_pool():
+    """Закрыть все соединения пула."""
+    global POOL
+    with POOL_LOCK:
+        if POOL is not None:
+            POOL.closeall()
+            POOL = None
+
+
+def base64_decoded_size(data: str) -> int:
+    """
+    Размер данных после декодирования Base64, без самого декодирования.
+    Пробельные символы и '=' в конце не учитываются.
+
+    Args:
+        data: строка в формате Base64
+
+    Returns:
+        размер в байтах
+    """
+    whitespace = data.count('\n') + data.count('\r') + data.count(' ') + data.count('\t')
+    padding = data[-8:].rstrip()[-2:].count('=')
+    return ((len(data) - whitespace) * 3) // 4 - padding
+
+
+def build_copy_buffer(rows: list, encoding: str) -> io.BytesIO:
+    """
+    Собрать поток для COPY images (pass_id, title, data) FROM STDIN (FORMAT binary).
+
+    Args:
+        rows: список кортежей (pass_id, title, data)
+        encoding: кодировка Python для текстовых полей (client_encoding соединения)
+
+    Returns:
+        BytesIO, готовый к чтению с начала
+    """
+    buffer = io.BytesIO()
+    buffer.write(COPY_BINARY_HEADER)
+    for pass_id, title, data in rows:
+        title_bytes = title.encode(encoding)
+        # 3 поля: int4 pass_id, text title, bytea data
+        buffer.write(struct.pack('!hii', 3, 4, pass_id))
+        buffer.write(struct.pack('!i', len(title_bytes)))
+        buffer.write(title_bytes)
+        buffer.write(struct.pack('!i', len(data)))
+        buffer.write(data)
+    buffer.write(COPY_BINARY_TRAILER)
+    buffer.seek(0)
+    return buffer
+
 
 class Database:
     """
     Класс для подключения и работы с PostgreSQL.
 
+    Соединения берутся из общего пула POOL (см. init_pool, get_pool).
+    Соединение хранится отдельно для каждого потока, поэтому один объект
+    Database можно использовать во всех запросах одновременно.
+    ID новых записей получаем только через INSERT ... RETURNING id:
+    lastval() привязан к сессии и при работе через пул ненадёжен.
     Все параметры подключения берутся из переменных окружения:
-    - FSTR_DB_HOST: адрес сервера БД
+    - FSTR_DB_HOST: адрес сервера БД (или pgbouncer)
     - FSTR_DB_PORT: порт
     - FSTR_DB_LOGIN: логин
     - FSTR_DB_PASS: пароль
     - FSTR_DB_NAME: название БД
+    - FSTR_DB_PREPARE: 0 чтобы не использовать PREPARE (нужно для pgbouncer)
+
+    Схема развёртывания под нагрузкой:
+    uvicorn workers (пул POOL в каждом) -> pgbouncer (pool_mode = transaction)
+    -> PostgreSQL. Вся работа с соединением укладывается в одну транзакцию,
+    поэтому приложение совместимо с transaction pooling при FSTR_DB_PREPARE=0.
     """
 
     def __init__(self):
-        """
-        Инициализация подключения к БД.
-        Все параметры берутся из переменных окружения.
-        """
-        self.host = os.getenv('FSTR_DB_HOST', 'localhost')
-        self.port = os.getenv('FSTR_DB_PORT', '5432')
-        self.user = os.getenv('FSTR_DB_LOGIN', 'postgres')
-        self.password = os.getenv('FSTR_DB_PASS', 'postgres')
-        self.database = os.getenv('FSTR_DB_NAME', 'mountain_passes')
-        self.connection = None
+        """Инициализация объекта, соединение берётся из пула в connect()."""
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> Optional[PooledConnection]:
+        """Соединение, взятое из пула текущим потоком."""
+        return getattr(self._local, 'connection', None)
+
+    @connection.setter
+    def connection(self, value: Optional[PooledConnection]):
+        self._local.connection = value
 
     def connect(self) -> bool:
         """
-        Подключиться к БД.
+        Взять соединение из пула.
         Возвращает True, если успешно, False если ошибка.
         """
+        pool = get_pool()
+        if pool is None:
+            return False
+
         try:
-            self.connection = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
+            self.connection = pool.getconn()
+            if USE_PREPARED_STATEMENTS and not self.connection.prepared:
+                self.prepare_statements()
             return True
         except psycopg2.Error as e:
             logger.error(f"Ошибка подключения к БД: {e}")
+            self.disconnect()
             return False
 
+    def prepare_statements(self):
+        """
+        Выполнить PREPARE для всех запросов из PREPARED_STATEMENTS.
+        Подготовленные запросы живут до закрытия физического соединения.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(PREPARE_SQL)
+        self.connection.commit()
+        cursor.close()
+        self.connection.prepared = True
+
     def disconnect(self):
-        """Отключиться от БД."""
+        """Вернуть соединение в пул."""
         if self.connection:
-            self.connection.close()
+            POOL.putconn(self.connection)
+            self.connection = None
+
+    def ping(self) -> bool:
+        """
+        Проверить доступность БД: SELECT 1 на соединении из пула.
+        Не готовит запросы и не трогает соединение текущего потока.
+
+        Returns:
+            True если БД отвечает, False если ошибка
+        """
+        pool = get_pool()
+        if pool is None:
+            return False
+
+        try:
+            connection = pool.getconn()
+        except psycopg2.Error as e:
+            logger.error(f"Ошибка подключения к БД: {e}")
+            return False
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute(PING_SQL)
+            cursor.close()
+            return True
+        except psycopg2.Error as e:
+            logger.error(f"Ошибка проверки соединения с БД: {e}")
+            return False
+        finally:
+            pool.putconn(connection)
 
     def execute_query(self, query: str, params: tuple = None) -> bool:
         """
@@ -127,234 +374,165 @@ class Database:
             logger.error(f"Ошибка при получении данных: {e}")
             return []
 
-    def get_last_insert_id(self) -> Optional[int]:
-        """
-        Получить ID последней вставленной записи.
-
-        Returns:
-            ID или None
-        """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT lastval()")
-            result = cursor.fetchone()
-            cursor.close()
-            return result[0] if result else None
-        except psycopg2.Error as e:
-            logger.error(f"Ошибка при получении ID: {e}")
-            return None
-
-    def create_user(self, email: str, phone: str, fam: str, name: str, otc: str) -> Optional[int]:
+    def create_submission(self, data: SubmitPassData) -> Optional[int]:
         """
-        Создать нового пользователя в БД.
+        Создать (или найти) пользователя, перевал и уровни сложности
+        одним запросом: вместо трёх сетевых обменов с БД выполняется один.
+        Транзакцию фиксирует вызывающий код.
 
         Args:
-            email: email пользователя
-            phone: телефон
-            fam: фамилия
-            name: имя
-            otc: отчество
+            data: объект SubmitPassData с информацией о перевале
 
         Returns:
-            ID созданного пользователя или None если ошибка
-        """
-        query = """
-            INSERT INTO users (email, phone, fam, name, otc)
-            VALUES (%s, %s, %s, %s, %s)
-            RETURNING id;
+            ID созданного перевала или None если ошибка
         """
+        user = data.user
+        coords = data.coords
+        level = data.level
 
         try:
             cursor = self.connection.cursor()
-            cursor.execute(query, (email, phone, fam, name, otc))
-            user_id = cursor.fetchone()[0]
-            self.connection.commit()
-            cursor.close()
-            return user_id
-        except psycopg2.IntegrityError:
-            # Пользователь с таким email уже существует
-            self.connection.rollback()
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT id FROM users WHERE email = %s", (email,))
-            result = cursor.fetchone()
+            cursor.execute(INSERT_SUBMISSION_SQL, (
+                user.email, user.phone, user.fam, user.name, user.otc,
+                data.beauty_title, data.title, data.other_titles, data.connect, data.add_time,
+                coords.latitude, coords.longitude, coords.height,
+                level.winter, level.spring, level.summer, level.autumn
+            ))
+            pass_id = cursor.fetchone()[0]
             cursor.close()
-            return result[0] if result else None
+            return pass_id
         except psycopg2.Error as e:
-            logger.error(f"Ошибка при создании пользователя: {e}")
+            logger.error(f"Ошибка при создании перевала: {e}")
             self.connection.rollback()
             return None
 
-    def create_pass(self, beauty_title: str, title: str, other_titles: str,
-                    connect: str, add_time: str, user_id: int,
-                    latitude: float, longitude: float, height: int) -> Optional[int]:
+    def create_images_bulk(self, rows: list) -> bool:
         """
-        Создать новый перевал в БД.
+        Сохранить несколько фотографий одним запросом INSERT ... VALUES (...), (...).
+        Транзакцию фиксирует вызывающий код.
 
         Args:
-            beauty_title: красивое название
-            title: название перевала
-            other_titles: другие названия
-            connect: что соединяет
-            add_time: время добавления
-            user_id: ID пользователя
-            latitude: широта
-            longitude: долгота
-            height: высота
+            rows: список кортежей (pass_id, title, data)
 
         Returns:
-            ID созданного перевала или None если ошибка
-        """
-        query = """
-            INSERT INTO passes (beauty_title, title, other_titles, connect, 
-                              add_time, user_id, latitude, longitude, height, status)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, 'new')
-            RETURNING id;
+            True если успешно, False если ошибка
         """
+        if not rows:
+            return True
+
+        rows = [(pass_id, title, psycopg2.Binary(data)) for pass_id, title, data in rows]
 
         try:
             cursor = self.connection.cursor()
-            cursor.execute(query, (beauty_title, title, other_titles, connect,
-                                   add_time, user_id, latitude, longitude, height))
-            pass_id = cursor.fetchone()[0]
-            self.connection.commit()
+            execute_values(cursor, INSERT_IMAGES_SQL, rows, page_size=100)
             cursor.close()
-            return pass_id
+            return True
         except psycopg2.Error as e:
-            logger.error(f"Ошибка при создании перевала: {e}")
+            logger.error(f"Ошибка при сохранении фотографий: {e}")
             self.connection.rollback()
-            return None
+            return False
 
-    def create_difficulty_level(self, pass_id: int, winter: str,
-                                spring: str, summer: str, autumn: str) -> bool:
+    def create_images_copy(self, rows: list) -> bool:
         """
-        Создать уровни сложности для перевала.
+        Сохранить фотографии через COPY ... FROM STDIN (FORMAT binary).
+        Быстрее INSERT при большом числе или объёме фотографий.
+        Транзакцию фиксирует вызывающий код.
 
         Args:
-            pass_id: ID перевала
-            winter: сложность зимой
-            spring: сложность весной
-            summer: сложность летом
-            autumn: сложность осенью
+            rows: список кортежей (pass_id, title, data)
 
         Returns:
             True если успешно, False если ошибка
         """
-        query = """
-            INSERT INTO difficulty_levels (pass_id, winter, spring, summer, autumn)
-            VALUES (%s, %s, %s, %s, %s);
-        """
+        if not rows:
+            return True
 
-        return self.execute_query(query, (pass_id, winter, spring, summer, autumn))
+        # Текстовые поля сервер читает в кодировке клиента (client_encoding)
+        buffer = build_copy_buffer(rows, encodings[self.connection.encoding])
 
-    def create_image(self, pass_id: int, title: str, image_data: bytes) -> bool:
+        try:
+            cursor = self.connection.cursor()
+            cursor.copy_expert(COPY_IMAGES_SQL, buffer)
+            cursor.close()
+            return True
+        except psycopg2.Error as e:
+            logger.error(f"Ошибка при сохранении фотографий: {e}")
+            self.connection.rollback()
+            return False
+
+    def create_images(self, rows: list) -> bool:
         """
-        Сохранить фотографию в БД.
+        Сохранить фотографии перевала.
+        Много или крупные фото сохраняются через COPY, остальные через INSERT.
 
         Args:
-            pass_id: ID перевала
-            title: название фото
-            image_data: данные изображения (байты)
+            rows: список кортежей (pass_id, title, data)
 
         Returns:
             True если успешно, False если ошибка
         """
-        query = """
-            INSERT INTO images (pass_id, title, data)
-            VALUES (%s, %s, %s);
-        """
-
-        return self.execute_query(query, (pass_id, title, image_data))
+        total_size = sum(len(data) for _, _, data in rows)
+        if len(rows) >= COPY_MIN_IMAGES or total_size > COPY_MIN_BYTES:
+            return self.create_images_copy(rows)
+        return self.create_images_bulk(rows)
 
-    def submit_pass_data(self, pass_data: Dict[str, Any]) -> Tuple[int, Optional[str], Optional[int]]:
+    def submit_pass_data(self, data: SubmitPassData) -> Tuple[int, Optional[str], Optional[int]]:
         """
         Главный метод для добавления информации о перевале в БД.
         Это метод вызывается из REST API.
 
         Args:
-            pass_data: словарь с информацией о перевале
+            data: объект SubmitPassData, уже проверенный Pydantic
 
         Returns:
             Кортеж (status_code, message, pass_id)
-            - status_code: 200 (успех), 400 (ошибка валидации), 500 (ошибка БД)
+            - status_code: 200 (успех), 500 (ошибка БД)
             - message: сообщение об ошибке (если есть)
             - pass_id: ID вставленного перевала (если успех)
         """
 
-        # Подключаемся к БД
+        # Декодируем фотографии до начала работы с БД
+        decoded_images = []
+        for image in data.images:
+            # Оцениваем размер по длине Base64, чтобы не декодировать слишком большие фото.
+            # Переводы строк и пробелы (Base64 с переносами по 76 символов)
+            # и '=' в конце данными не являются
+            if base64_decoded_size(image.data) > MAX_IMAGE_SIZE:
+                logger.warning(f"Изображение '{image.title}' слишком большое, пропускаем")
+                continue
+
+            try:
+                image_bytes = a2b_base64(image.data)
+            except ValueError as e:
+                logger.error(f"Ошибка при обработке изображения '{image.title}': {e}")
+                # продолжаем, даже если одно фото не загрузилось
+                continue
+
+            # проверяем размер
+            if len(image_bytes) > MAX_IMAGE_SIZE:
+                logger.warning(f"Изображение '{image.title}' слишком большое, пропускаем")
+                continue
+
+            decoded_images.append((image.title, image_bytes))
+
+        # Берём соединение из пула
         if not self.connect():
             return 500, "Ошибка подключения к базе данных", None
 
         try:
-            # Извлекаем данные пользователя
-            user_data = pass_data.get('user', {})
-            email = user_data.get('email')
-            phone = user_data.get('phone')
-            fam = user_data.get('fam')
-            name = user_data.get('name')
-            otc = user_data.get('otc')
-
-            # Проверяем, что все поля есть
-            if not all([email, phone, fam, name, otc]):
-                return 400, "Не хватает полей в данных пользователя", None
-
-            # Создаём или получаем пользователя
-            user_id = self.create_user(email, phone, fam, name, otc)
-            if not user_id:
-                return 500, "Ошибка при создании пользователя", None
-
-            # Извлекаем данные перевала
-            coords = pass_data.get('coords', {})
-            level = pass_data.get('level', {})
-            images = pass_data.get('images', [])
-
-            beauty_title = pass_data.get('beauty_title', '')
-            title = pass_data.get('title')
-            other_titles = pass_data.get('other_titles', '')
-            connect = pass_data.get('connect', '')
-            add_time = pass_data.get('add_time')
-            latitude = float(coords.get('latitude', 0))
-            longitude = float(coords.get('longitude', 0))
-            height = int(coords.get('height', 0))
-
-            # Проверяем, что все обязательные поля есть
-            if not all([title, add_time]):
-                return 400, "Не хватает обязательных полей", None
-
-            # Создаём перевал
-            pass_id = self.create_pass(beauty_title, title, other_titles,
-                                       connect, add_time, user_id,
-                                       latitude, longitude, height)
-            if not pass_id:
-                return 500, "Ошибка при создании перевала", None
-
-            # Добавляем уровни сложности
-            self.create_difficulty_level(
-                pass_id,
-                level.get('winter', ''),
-                level.get('spring', ''),
-                level.get('summer', ''),
-                level.get('autumn', '')
-            )
-
-            # Добавляем фотографии
-            for image in images:
-                image_title = image.get('title', '')
-                image_data = image.get('data', '')
-
-                # Декодируем Base64 данные
-                try:
-                    image_bytes = base64.b64decode(image_data)
-
-                    # проверяем размер
-                    if len(image_bytes) > MAX_IMAGE_SIZE:
-                        logger.warning(f"Изображение '{image_title}' слишком большое, пропускаем")
-                        continue
-
-                    self.create_image(pass_id, image_title, image_bytes)
-
-                except Exception as e:
-                    logger.error(f"Ошибка при обработке изображения '{image_title}': {e}")
-                    # продолжаем, даже если одно фото не загрузилось
+            # Все вставки выполняются в одной транзакции:
+            # commit при выходе из блока, rollback при исключении
+            with self.connection:
+                # Создаём пользователя, перевал и уровни сложности
+                pass_id = self.create_submission(data)
+                if not pass_id:
+                    return 500, "Ошибка при создании перевала", None
+
+                # Сохраняем все фотографии одним запросом
+                image_rows = [(pass_id, image_title, image_bytes)
+                              for image_title, image_bytes in decoded_images]
+                if not self.create_images(image_rows):
+                    return 500, "Ошибка при сохранении фотографий", None
 
             return 200, None, pass_id
 
@@ -363,5 +541,5 @@ class Database:
             return 500, "Ошибка при обработке данных", None
 
         finally:
-            # Всегда отключаемся от БД
+            # Всегда возвращаем соединение в пул
             self.disconnect()
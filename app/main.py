@@ -7,37 +7,157 @@ REST API для системы управления перевалами.
 """
 
 import os
+import asyncio
 import logging
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
-from dotenv import load_dotenv
+import psycopg2
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.models import SubmitPassData, SubmitPassResponse
-from app.database import Database
+from app.database import Database, init_pool, close_pool, POOL_MAX_CONN
 
-# Загружаем переменные окружения из файла .env
-load_dotenv()
-
-# Настраиваем логирование (один раз на всё приложение)
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+MAX_REQUEST_SIZE = 50 * 1024 * 1024  # 50 мегабайт
+
 # Создаём приложение FastAPI
 app = FastAPI(
     title="Mountain Passes API",
     description="REST API для управления информацией о горных перевалах",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 
+# Один объект Database на всё приложение (соединения берутся из пула)
+db_instance = Database()
+
+# Потоки для блокирующих вызовов psycopg2. Их не больше, чем соединений в пуле:
+# пул не ждёт освобождения соединения, а сразу выдаёт ошибку
+db_executor = ThreadPoolExecutor(max_workers=POOL_MAX_CONN, thread_name_prefix="db")
+
+
+async def run_in_db_thread(func, *args):
+    """Выполнить блокирующий вызов к БД в потоке из db_executor."""
+    return await asyncio.get_running_loop().run_in_executor(db_executor, func, *args)
+
+
+async def get_db() -> Database:
+    """
+    Зависимость FastAPI: общий объект для работы с БД.
+    Объявлена async, чтобы FastAPI не запускал её в пуле потоков.
+    """
+    return db_instance
+
+
+class RequestSizeLimitMiddleware:
+    """
+    ASGI middleware: отклоняет слишком большие запросы.
+    Сначала проверяет заголовок Content-Length (не читая тело),
+    затем считает размер тела по частям — это нужно для запросов
+    с Transfer-Encoding: chunked, у которых Content-Length нет.
+    """
+
+    def __init__(self, app, max_size: int):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_size:
+                    await self.reject(scope, receive, send)
+                    return
+                break
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive():
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    # Отвечаем 413 сами, а приложению сообщаем, что клиент отключился
+                    rejected = True
+                    if not response_started:
+                        await self.reject(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # Ошибка из-за оборванного тела уже обработана ответом 413
+            if not rejected:
+                raise
+
+    @staticmethod
+    async def reject(scope, receive, send):
+        """Отправить ответ 413 в формате API."""
+        response = JSONResponse(
+            status_code=413,
+            content={
+                "status": 413,
+                "message": "Слишком большой запрос",
+                "id": None
+            }
+        )
+        await response(scope, receive, send)
+
+
+app.add_middleware(RequestSizeLimitMiddleware, max_size=MAX_REQUEST_SIZE)
+
+
+@app.on_event("startup")
+def startup():
+    """
+    Настраиваем логирование и создаём пул соединений с БД
+    при старте приложения (в каждом worker-процессе).
+    Если БД недоступна, приложение всё равно запускается:
+    пул будет создан при первом обращении к БД.
+    """
+    logging.basicConfig(level=logging.INFO)
+    try:
+        init_pool()
+    except psycopg2.Error as e:
+        logger.error(f"Не удалось подключиться к БД при старте: {e}")
+
+
+@app.on_event("shutdown")
+def shutdown():
+    """Останавливаем потоки для БД и закрываем все соединения пула."""
+    db_executor.shutdown(wait=True)
+    close_pool()
+
+
 # ============== ГЛАВНЫЙ МЕТОД REST API ==============
 
 @app.post(
     "/submitData",
-    response_model=SubmitPassResponse,
+    response_model=None,
+    responses={200: {"model": SubmitPassResponse}},
     summary="Добавить информацию о перевале",
     tags=["Passes"]
 )
-async def submit_data(data: SubmitPassData) -> SubmitPassResponse:
+async def submit_data(data: SubmitPassData, db: Database = Depends(get_db)) -> ORJSONResponse:
 
     """
     Метод для отправки информации о новом перевале.
@@ -46,9 +166,11 @@ async def submit_data(data: SubmitPassData) -> SubmitPassResponse:
 
     Args:
         data: объект SubmitPassData с информацией о перевале
+        db: общий объект Database (см. get_db)
 
     Returns:
-        SubmitPassResponse с результатом (status, message, id)
+        JSON в формате SubmitPassResponse (status, message, id).
+        Ответ сериализуется напрямую, без повторной валидации моделью
 
     Примеры ответов:
         - {"status": 200, "message": null, "id": 42}
@@ -56,31 +178,17 @@ async def submit_data(data: SubmitPassData) -> SubmitPassResponse:
         - {"status": 500, "message": "Ошибка БД", "id": null}
     """
 
-    try:
-        # Преобразуем объект Pydantic в словарь
-        pass_data = data.model_dump()
-
-        # Создаём объект класса Database для работы с PostgreSQL
-        db = Database()
-
-        # Вызываем метод для добавления данных в БД
-        status_code, message, pass_id = db.submit_pass_data(pass_data)
+    # Вызываем метод для добавления данных в БД.
+    # psycopg2 блокирующий, поэтому работаем в отдельном потоке,
+    # чтобы не останавливать цикл событий
+    status_code, message, pass_id = await run_in_db_thread(db.submit_pass_data, data)
 
-        # Возвращаем ответ в нужном формате
-        return SubmitPassResponse(
-            status=status_code,
-            message=message,
-            id=pass_id
-        )
-
-    except Exception as e:
-        # Если случилась непредвиденная ошибка
-        logger.error(f"Ошибка в методе submit_data: {e}")
-        return SubmitPassResponse(
-            status=500,
-            message="Внутренняя ошибка сервера при обработке запроса",
-            id=None
-        )
+    # Возвращаем ответ в нужном формате
+    return ORJSONResponse({
+        "status": status_code,
+        "message": message,
+        "id": pass_id
+    })
 
 
 # ============== ВСПОМОГАТЕЛЬНЫЕ МЕТОДЫ ==============
@@ -104,14 +212,12 @@ async def root():
 
 
 @app.get("/health", tags=["Info"])
-async def health_check():
+async def health_check(db: Database = Depends(get_db)):
     """
     Проверка здоровья приложения.
-    Пытается подключиться к БД.
+    Берёт соединение из пула и выполняет SELECT 1.
     """
-    db = Database()
-    if db.connect():
-        db.disconnect()
+    if await run_in_db_thread(db.ping):
         return {
             "status": "healthy",
             "database": "connected"
@@ -151,32 +257,28 @@ async def value_error_handler(request, exc):
     )
 
 
-@app.exception_handler(Exception)
-async def general_exception_handler(request, exc):
-    """Обработка всех остальных ошибок."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "status": 500,
-            "message": "Ошибка сервера",
-            "id": None
-        }
-    )
-
-
 # ============== ЗАПУСК ПРИЛОЖЕНИЯ ==============
 
 if __name__ == "__main__":
     import uvicorn
 
     # Запускаем приложение
-    # --reload: перезагружает сервер при изменении кода
     # --host: слушаем на всех интерфейсах
     # --port: используем порт 8000
+    # --loop/--http: uvloop и httptools быстрее стандартных asyncio и h11
+    # (loop="auto" берёт uvloop, если он установлен; на Windows его нет)
+    # --workers: по одному процессу на ядро (reload выключен, он несовместим с workers).
+    # Число процессов передаём worker-ам через WEB_CONCURRENCY: по нему
+    # делится общий бюджет соединений FSTR_DB_POOL_MAX (см. app/database.py)
+    workers = int(os.getenv("WEB_CONCURRENCY") or os.cpu_count())
+    os.environ["WEB_CONCURRENCY"] = str(workers)
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="auto",
+        http="httptools",
+        workers=workers,
+        reload=False,
         log_level="info"
     )
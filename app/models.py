@@ -4,7 +4,7 @@
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserData(BaseModel):
@@ -12,14 +12,17 @@ class UserData(BaseModel):
     Модель данных пользователя.
     Содержит информацию о человеке, отправившем данные о перевале.
     """
-    email: EmailStr  # email должен быть валидным
+    # email должен быть валидным (простая проверка регулярным выражением)
+    email: str = Field(..., pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$', max_length=254)
     phone: str = Field(..., min_length=5, max_length=20)  # телефон
     fam: str = Field(..., min_length=1, max_length=100)   # фамилия
     name: str = Field(..., min_length=1, max_length=100)  # имя
     otc: str = Field(..., min_length=1, max_length=100)   # отчество
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='ignore',
+        json_schema_extra={
             "example": {
                 "email": "qwerty@mail.ru",
                 "phone": "+7 555 55 55",
@@ -28,6 +31,7 @@ class UserData(BaseModel):
                 "otc": "Иванович"
             }
         }
+    )
 
 
 class ImageData(BaseModel):
@@ -37,13 +41,16 @@ class ImageData(BaseModel):
     data: str  # фото в формате Base64
     title: str = Field(..., min_length=1, max_length=255)  # название фото
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='ignore',
+        json_schema_extra={
             "example": {
                 "data": "base64encodedimagedata",
                 "title": "Седловина"
             }
         }
+    )
 
 
 class DifficultyLevel(BaseModel):
@@ -55,8 +62,10 @@ class DifficultyLevel(BaseModel):
     summer: Optional[str] = Field(default="", max_length=5)
     autumn: Optional[str] = Field(default="", max_length=5)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='ignore',
+        json_schema_extra={
             "example": {
                 "winter": "",
                 "spring": "1А",
@@ -64,24 +73,28 @@ class DifficultyLevel(BaseModel):
                 "autumn": ""
             }
         }
+    )
 
 
 class CoordinatesData(BaseModel):
     """
     Модель для координат перевала.
     """
-    latitude: str  # широта
-    longitude: str  # долгота
-    height: str  # высота в метрах
-
-    class Config:
-        json_schema_extra = {
+    latitude: float  # широта
+    longitude: float  # долгота
+    height: int  # высота в метрах
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra='ignore',
+        json_schema_extra={
             "example": {
-                "latitude": "45.3842",
-                "longitude": "7.1525",
-                "height": "1200"
+                "latitude": 45.3842,
+                "longitude": 7.1525,
+                "height": 1200
             }
         }
+    )
 
 
 class SubmitPassData(BaseModel):
@@ -93,14 +106,16 @@ class SubmitPassData(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
     other_titles: Optional[str] = Field(default="", max_length=255)
     connect: Optional[str] = Field(default="")
-    add_time: str  # формат: "2021-09-22 13:18:13"
+    add_time: str = Field(..., min_length=1)  # формат: "2021-09-22 13:18:13"
     user: UserData
     coords: CoordinatesData
     level: DifficultyLevel
     images: List[ImageData] = Field(default_factory=list)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='ignore',
+        json_schema_extra={
             "example": {
                 "beauty_title": "пер.",
                 "title": "Пхия",
@@ -115,9 +130,9 @@ class SubmitPassData(BaseModel):
                     "otc": "Иванович"
                 },
                 "coords": {
-                    "latitude": "45.3842",
-                    "longitude": "7.1525",
-                    "height": "1200"
+                    "latitude": 45.3842,
+                    "longitude": 7.1525,
+                    "height": 1200
                 },
                 "level": {
                     "winter": "",
@@ -131,6 +146,7 @@ class SubmitPassData(BaseModel):
                 ]
             }
         }
+    )
 
 
 class SubmitPassResponse(BaseModel):
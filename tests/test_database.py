@@ -0,0 +1,83 @@
+"""
+Тесты для вспомогательных функций app/database.py:
+оценки размера Base64 и сборки бинарного потока COPY.
+"""
+
+import base64
+import struct
+import unittest
+
+from app.database import base64_decoded_size, build_copy_buffer, COPY_BINARY_HEADER
+
+
+def parse_copy_buffer(raw: bytes) -> list:
+    """Разобрать поток COPY (FORMAT binary) на список кортежей из байтов полей."""
+    assert raw[:11] == b'PGCOPY\n\xff\r\n\x00'
+    flags, extension_length = struct.unpack('!ii', raw[11:19])
+    assert flags == 0 and extension_length == 0
+
+    rows = []
+    offset = 19
+    while True:
+        (fields_count,) = struct.unpack('!h', raw[offset:offset + 2])
+        offset += 2
+        if fields_count == -1:
+            break
+
+        fields = []
+        for _ in range(fields_count):
+            (length,) = struct.unpack('!i', raw[offset:offset + 4])
+            offset += 4
+            fields.append(raw[offset:offset + length])
+            offset += length
+        rows.append(tuple(fields))
+
+    # после завершающего -1 данных быть не должно
+    assert offset == len(raw)
+    return rows
+
+
+class BuildCopyBufferTest(unittest.TestCase):
+
+    def test_header_and_trailer_without_rows(self):
+        raw = build_copy_buffer([], 'utf_8').getvalue()
+        self.assertEqual(raw, COPY_BINARY_HEADER + struct.pack('!h', -1))
+        self.assertEqual(parse_copy_buffer(raw), [])
+
+    def test_rows_have_three_fields(self):
+        rows = [(42, 'Седловина', b'\x00\xffjpeg'), (7, '', b'')]
+        parsed = parse_copy_buffer(build_copy_buffer(rows, 'utf_8').getvalue())
+
+        self.assertEqual(parsed, [
+            (struct.pack('!i', 42), 'Седловина'.encode('utf-8'), b'\x00\xffjpeg'),
+            (struct.pack('!i', 7), b'', b''),
+        ])
+
+    def test_title_uses_client_encoding(self):
+        rows = [(1, 'Подъём', b'data')]
+        parsed = parse_copy_buffer(build_copy_buffer(rows, 'cp1251').getvalue())
+
+        self.assertEqual(parsed[0][1], 'Подъём'.encode('cp1251'))
+
+    def test_buffer_is_rewound(self):
+        buffer = build_copy_buffer([(1, 'a', b'b')], 'utf_8')
+        self.assertEqual(buffer.tell(), 0)
+
+
+class Base64DecodedSizeTest(unittest.TestCase):
+
+    def test_matches_decoded_size_with_padding(self):
+        for size in (0, 1, 2, 3, 4, 5, 1000, 1001, 1002):
+            data = base64.b64encode(b'x' * size).decode()
+            self.assertEqual(base64_decoded_size(data), size)
+
+    def test_ignores_line_breaks(self):
+        for size in (1000, 1001, 1002):
+            data = base64.encodebytes(b'x' * size).decode()
+            self.assertTrue(data.endswith('\n'))
+            self.assertEqual(base64_decoded_size(data), size)
+            self.assertEqual(base64_decoded_size(data.replace('\n', '\r\n')), size)
+
+
+if __name__ == '__main__':
+    unittest.main()